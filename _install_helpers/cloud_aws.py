@@ -2,25 +2,76 @@
 
 import json
 import subprocess
+from concurrent.futures import Future
+from functools import lru_cache
 from typing import Optional, List
 from .ui import print_error, print_info, print_section, print_success, print_warning
 from .input_utils import get_input
 
+# boto3 is optional - when available, AWS calls are made in-process over a
+# shared session instead of spawning the aws CLI for every operation
+try:
+    import boto3
+    from botocore.exceptions import BotoCoreError, ClientError
+    BOTO3_AVAILABLE = True
+except ImportError:
+    BOTO3_AVAILABLE = False
 
-def get_eks_nodegroup_role(cluster_name: str) -> Optional[str]:
+IAM_POLICY_NAME = 'LaminarDataPlaneS3Access'
+
+# Static argv prefixes for the aws CLI fallback; per-call arguments are appended
+EKS_LIST_NODEGROUPS_CMD = ('aws', 'eks', 'list-nodegroups', '--output', 'json')
+EKS_DESCRIBE_NODEGROUP_CMD = ('aws', 'eks', 'describe-nodegroup', '--output', 'json')
+IAM_PUT_ROLE_POLICY_CMD = ('aws', 'iam', 'put-role-policy', '--policy-name', IAM_POLICY_NAME)
+
+
+@lru_cache(maxsize=None)
+def _get_boto3_client(service: str, region: Optional[str] = None):
+    """Return a cached boto3 client for the given service and region."""
+    return boto3.client(service, region_name=region)
+
+
+def _get_eks_nodegroup_role_sdk(cluster_name: str, region: Optional[str]) -> Optional[str]:
+    """Resolve the node group IAM role name using boto3."""
+    try:
+        eks = _get_boto3_client('eks', region)
+        nodegroups = eks.list_nodegroups(clusterName=cluster_name).get('nodegroups', [])
+        if not nodegroups:
+            return None
+        
+        role_arn = eks.describe_nodegroup(
+            clusterName=cluster_name,
+            nodegroupName=nodegroups[0]
+        )['nodegroup'].get('nodeRole', '')
+        
+        if role_arn and '/' in role_arn:
+            return role_arn.rsplit('/', 1)[-1]
+        return None
+    except (BotoCoreError, ClientError, KeyError):
+        return None
+
+
+def get_eks_nodegroup_role(cluster_name: str, region: Optional[str] = None) -> Optional[str]:
     """
     Get the IAM role name for an EKS node group.
     
+    Uses boto3 when installed, otherwise falls back to the aws CLI.
+    
     Args:
         cluster_name: Name of the EKS cluster
+        region: AWS region (defaults to the configured AWS region)
         
     Returns:
         IAM role name or None if not found
     """
+    if BOTO3_AVAILABLE:
+        return _get_eks_nodegroup_role_sdk(cluster_name, region)
+    
+    region_args = ('--region', region) if region else ()
     try:
         result = subprocess.run(
-            ['aws', 'eks', 'list-nodegroups', '--cluster-name', cluster_name],
-            capture_output=True, text=True, check=True
+            (*EKS_LIST_NODEGROUPS_CMD, '--cluster-name', cluster_name, *region_args),
+            capture_output=True, check=True
         )
         nodegroups = json.loads(result.stdout).get('nodegroups', [])
         if not nodegroups:
@@ -28,25 +79,29 @@ def get_eks_nodegroup_role(cluster_name: str) -> Optional[str]:
         
         nodegroup_name = nodegroups[0]
         result = subprocess.run(
-            [
-                'aws', 'eks', 'describe-nodegroup',
+            (
+                *EKS_DESCRIBE_NODEGROUP_CMD,
                 '--cluster-name', cluster_name,
                 '--nodegroup-name', nodegroup_name,
-                '--query', 'nodegroup.nodeRole',
-                '--output', 'text'
-            ],
-            capture_output=True, text=True, check=True
+                *region_args
+            ),
+            capture_output=True, check=True
         )
-        role_arn = result.stdout.strip()
+        role_arn = json.loads(result.stdout)['nodegroup'].get('nodeRole', '')
         
         if role_arn and '/' in role_arn:
-            return role_arn.split('/')[-1]
+            return role_arn.rsplit('/', 1)[-1]
         return None
-    except (subprocess.CalledProcessError, json.JSONDecodeError, FileNotFoundError):
+    except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError, FileNotFoundError):
         return None
 
 
-def setup_aws_iam_policy(cluster_name: str, buckets: List[str], region: str) -> bool:
+def setup_aws_iam_policy(
+    cluster_name: str,
+    buckets: List[str],
+    region: str,
+    role_lookup: Optional[Future] = None
+) -> bool:
     """
     Attach S3 permissions to the EKS node group IAM role.
     
@@ -54,6 +109,7 @@ def setup_aws_iam_policy(cluster_name: str, buckets: List[str], region: str) ->
         cluster_name: Name of the EKS cluster
         buckets: List of S3 bucket names to grant access to
         region: AWS region
+        role_lookup: Already-running get_eks_nodegroup_role() call to reuse
         
     Returns:
         True if successful, False otherwise
@@ -61,7 +117,10 @@ def setup_aws_iam_policy(cluster_name: str, buckets: List[str], region: str) ->
     print_section("Setting Up AWS IAM Permissions")
     
     print_info("Detecting EKS node group IAM role...")
-    role_name = get_eks_nodegroup_role(cluster_name)
+    if role_lookup is not None:
+        role_name = role_lookup.result()
+    else:
+        role_name = get_eks_nodegroup_role(cluster_name, region)
     
     if not role_name:
         print_warning("Could not automatically detect node group IAM role")
@@ -69,12 +128,11 @@ def setup_aws_iam_policy(cluster_name: str, buckets: List[str], region: str) ->
     else:
         print_success(f"Detected IAM role: {role_name}")
     
-    resources = []
-    for bucket in buckets:
-        resources.extend([
-            f"arn:aws:s3:::{bucket}/*",
-            f"arn:aws:s3:::{bucket}"
-        ])
+    resources = [
+        arn
+        for bucket in buckets
+        for arn in (f"arn:aws:s3:::{bucket}/*", f"arn:aws:s3:::{bucket}")
+    ]
     
     policy_doc = {
         "Version": "2012-10-17",
@@ -91,14 +149,26 @@ def setup_aws_iam_policy(cluster_name: str, buckets: List[str], region: str) ->
     }
     
     print_info("Attaching S3 access policy to IAM role...")
+    if BOTO3_AVAILABLE:
+        try:
+            _get_boto3_client('iam').put_role_policy(
+                RoleName=role_name,
+                PolicyName=IAM_POLICY_NAME,
+                PolicyDocument=json.dumps(policy_doc)
+            )
+            print_success("IAM policy attached successfully")
+            return True
+        except (BotoCoreError, ClientError) as e:
+            print_error(f"Failed to attach IAM policy: {e}")
+            return False
+    
     try:
         subprocess.run(
-            [
-                'aws', 'iam', 'put-role-policy',
+            (
+                *IAM_PUT_ROLE_POLICY_CMD,
                 '--role-name', role_name,
-                '--policy-name', 'LaminarDataPlaneS3Access',
                 '--policy-document', json.dumps(policy_doc)
-            ],
+            ),
             capture_output=True, text=True, check=True
         )
         print_success("IAM policy attached successfully")
@@ -1,12 +1,37 @@
 """GCP-specific operations for GKE and HMAC key management."""
 
+import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from typing import Optional, List, Tuple
+from .constants import MAX_PARALLEL_CLI_CALLS
 from .ui import print_error, print_info, print_section, print_success, print_warning
 
+# google-cloud-storage is optional - when available, bucket IAM bindings and
+# HMAC keys are managed in-process instead of through gcloud/gsutil
+try:
+    from google.cloud import storage
+    from google.api_core.exceptions import Conflict, GoogleAPIError, PreconditionFailed
+    from google.auth.exceptions import GoogleAuthError
+    GCS_SDK_AVAILABLE = True
+except ImportError:
+    GCS_SDK_AVAILABLE = False
+
 
 SERVICE_ACCOUNT_NAME = 'laminar-workload'
 K8S_SERVICE_ACCOUNT_NAME = 'laminar-workload-sa'
+BUCKET_ROLE = 'roles/storage.objectAdmin'
+IAM_POLICY_VERSION = 3
+
+# Static argv prefixes for the gcloud/gsutil fallback; per-call arguments are appended
+BUCKET_ADD_BINDING_CMD = ('gcloud', 'storage', 'buckets', 'add-iam-policy-binding')
+HMAC_CREATE_CMD = ('gsutil', 'hmac', 'create')
+
+# Matches 'gsutil hmac create' output:
+# Access ID:   GOOG1E...
+# Secret:      abc123...
+HMAC_OUTPUT_RE = re.compile(r'^Access ID:\s*(\S+)\s+^Secret:\s*(\S+)', re.MULTILINE)
 
 
 def get_gcp_project_from_context(context: str) -> Optional[str]:
@@ -28,6 +53,111 @@ def get_gcp_project_from_context(context: str) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=None)
+def _get_storage_client(project_id: str):
+    """Return a cached google-cloud-storage client for the given project."""
+    return storage.Client(project=project_id)
+
+
+def _grant_bucket_access_sdk(project_id: str, bucket: str, sa_email: str) -> Tuple[str, str]:
+    """Grant Storage Object Admin on a bucket with one get/set policy round-trip."""
+    member = f'serviceAccount:{sa_email}'
+    try:
+        gcs_bucket = _get_storage_client(project_id).bucket(bucket)
+        # The policy is written with its etag; retry once if another writer raced us
+        for attempt in range(2):
+            policy = gcs_bucket.get_iam_policy(requested_policy_version=IAM_POLICY_VERSION)
+            for binding in policy.bindings:
+                if (binding['role'] == BUCKET_ROLE and not binding.get('condition')
+                        and member in binding['members']):
+                    return ('exists', '')
+            policy.bindings.append({'role': BUCKET_ROLE, 'members': {member}})
+            try:
+                gcs_bucket.set_iam_policy(policy)
+                return ('granted', '')
+            except (Conflict, PreconditionFailed):
+                if attempt:
+                    raise
+    except (GoogleAPIError, GoogleAuthError) as e:
+        return ('failed', str(e))
+
+
+def _grant_bucket_access(project_id: str, bucket: str, sa_email: str) -> Tuple[str, str]:
+    """
+    Grant Storage Object Admin on a single bucket to a service account.
+    
+    Uses google-cloud-storage when installed, otherwise falls back to gcloud.
+    
+    Args:
+        project_id: GCP project ID
+        bucket: GCS bucket name
+        sa_email: Service account email
+        
+    Returns:
+        Tuple of (status, error detail) where status is 'granted', 'exists' or 'failed'
+    """
+    if GCS_SDK_AVAILABLE:
+        return _grant_bucket_access_sdk(project_id, bucket, sa_email)
+    
+    result = subprocess.run(
+        (
+            *BUCKET_ADD_BINDING_CMD,
+            f'gs://{bucket}',
+            '--member', f'serviceAccount:{sa_email}',
+            '--role', BUCKET_ROLE
+        ),
+        capture_output=True, text=True
+    )
+    
+    if result.returncode == 0:
+        return ('granted', '')
+    # Check if it's just a "binding already exists" case
+    if 'already exists' in result.stderr.lower() or 'no change' in result.stderr.lower():
+        return ('exists', '')
+    return ('failed', result.stderr)
+
+
+def _create_hmac_key(project_id: str, sa_email: str) -> Optional[Tuple[str, str]]:
+    """
+    Create an HMAC key for a service account.
+    
+    Uses google-cloud-storage when installed, otherwise falls back to gsutil.
+    
+    Args:
+        project_id: GCP project ID
+        sa_email: Service account email
+        
+    Returns:
+        Tuple of (access_id, secret) or None if creation failed
+    """
+    if GCS_SDK_AVAILABLE:
+        try:
+            metadata, secret = _get_storage_client(project_id).create_hmac_key(
+                service_account_email=sa_email
+            )
+            return (metadata.access_id, secret)
+        except (GoogleAPIError, GoogleAuthError) as e:
+            print_error(f"Failed to create HMAC keys: {e}")
+            return None
+    
+    result = subprocess.run(
+        (*HMAC_CREATE_CMD, sa_email),
+        capture_output=True, text=True
+    )
+    
+    if result.returncode != 0:
+        print_error(f"Failed to create HMAC keys: {result.stderr}")
+        return None
+    
+    match = HMAC_OUTPUT_RE.search(result.stdout)
+    if not match:
+        print_error("Failed to parse HMAC keys from gsutil output")
+        return None
+    
+    access_id, secret = match.groups()
+    return (access_id, secret)
+
+
 def create_gcs_hmac_keys(
     project_id: str,
     buckets: List[str]
@@ -70,56 +200,31 @@ def create_gcs_hmac_keys(
     # Grant bucket-level permissions (scope to specific buckets, not project-wide)
     print_info(f"Granting Storage Object Admin role on {len(buckets)} bucket(s)...")
     all_success = True
-    for bucket in buckets:
-        result = subprocess.run(
-            [
-                'gcloud', 'storage', 'buckets', 'add-iam-policy-binding',
-                f'gs://{bucket}',
-                '--member', f'serviceAccount:{sa_email}',
-                '--role', 'roles/storage.objectAdmin'
-            ],
-            capture_output=True, text=True
-        )
-        
-        if result.returncode == 0:
-            print_success(f"  ✓ Permissions granted for bucket: {bucket}")
-        else:
-            # Check if it's just a "binding already exists" case
-            if 'already exists' in result.stderr.lower() or 'no change' in result.stderr.lower():
+    with ThreadPoolExecutor(max_workers=max(1, min(len(buckets), MAX_PARALLEL_CLI_CALLS))) as executor:
+        futures = {
+            executor.submit(_grant_bucket_access, project_id, bucket, sa_email): bucket
+            for bucket in buckets
+        }
+        for future in as_completed(futures):
+            bucket = futures[future]
+            status, detail = future.result()
+            
+            if status == 'granted':
+                print_success(f"  ✓ Permissions granted for bucket: {bucket}")
+            elif status == 'exists':
                 print_info(f"  ✓ Permissions already exist for bucket: {bucket}")
             else:
-                print_warning(f"  ✗ Failed to grant permissions for bucket {bucket}: {result.stderr[:100]}")
+                print_warning(f"  ✗ Failed to grant permissions for bucket {bucket}: {detail[:100]}")
                 all_success = False
     
     if not all_success:
         print_warning("Some bucket permissions may need manual configuration")
     
     print_info(f"Creating HMAC keys for service account: {sa_email}...")
-    result = subprocess.run(
-        ['gsutil', 'hmac', 'create', sa_email],
-        capture_output=True, text=True
-    )
-    
-    if result.returncode != 0:
-        print_error(f"Failed to create HMAC keys: {result.stderr}")
-        return None
-    
-    # Parse the output to extract Access ID and Secret
-    # Output format:
-    # Access ID:   GOOG1E...
-    # Secret:      abc123...
-    access_id = None
-    secret = None
-    
-    for line in result.stdout.splitlines():
-        if line.startswith('Access ID:'):
-            access_id = line.split(':', 1)[1].strip()
-        elif line.startswith('Secret:'):
-            secret = line.split(':', 1)[1].strip()
-    
-    if not access_id or not secret:
-        print_error("Failed to parse HMAC keys from gsutil output")
+    hmac_keys = _create_hmac_key(project_id, sa_email)
+    if not hmac_keys:
         return None
+    access_id, secret = hmac_keys
     
     print()
     print_success("HMAC keys created successfully!")
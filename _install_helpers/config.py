@@ -1,6 +1,6 @@
 """Interactive configuration collection and orchestration."""
 
-import getpass
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, Any, Optional, Callable
 from .constants import (
     DEFAULT_AWS_REGION, DEFAULT_GCP_REGION, DEFAULT_NAMESPACE,
@@ -10,11 +10,11 @@ from .constants import (
 )
 from .ui import print_section, print_info, print_success, print_warning
 from .input_utils import (
-    get_input, get_yes_no, get_choice, get_int_input,
+    get_input, get_secret, get_yes_no, get_choice, get_int_input,
     generate_secure_password, generate_bucket_suffix
 )
 from .prerequisites import check_cloud_cli
-from .cloud_aws import setup_aws_iam_policy
+from .cloud_aws import get_eks_nodegroup_role, setup_aws_iam_policy
 from .cloud_gcp import get_gcp_project_from_context, create_gcs_hmac_keys
 from .storage import parse_existing_buckets, configure_bucket, construct_s3_endpoint
 from .kubernetes import get_recommended_storage_class
@@ -63,6 +63,10 @@ def configure(context: Optional[str]) -> Dict[str, Any]:
         Configuration dictionary
     """
     config = {}
+    # Background probes started once the cloud provider is known, so their
+    # subprocess time overlaps with the user answering the next prompts
+    executor = ThreadPoolExecutor(max_workers=2)
+    probes: Dict[str, Future] = {}
 
     # Step 1: Namespace
     def _step_namespace():
@@ -77,6 +81,10 @@ def configure(context: Optional[str]) -> Dict[str, Any]:
         cloud_options = ["AWS", "GCP"]
         cloud_idx = get_choice("Select your cloud provider:", cloud_options)
         config['cloud_provider'] = cloud_options[cloud_idx].lower()
+        probes['has_cloud_cli'] = executor.submit(check_cloud_cli, config['cloud_provider'])
+        probes['storage_class'] = executor.submit(
+            get_recommended_storage_class, config['cloud_provider']
+        )
 
         if config['cloud_provider'] == 'aws':
             print_info("Common AWS regions: us-east-1, us-west-2, eu-west-1")
@@ -119,7 +127,7 @@ def configure(context: Optional[str]) -> Dict[str, Any]:
             print_warning("Please save this password securely!")
         else:
             while True:
-                password = getpass.getpass("Enter ClickHouse password: ")
+                password = get_secret("Enter ClickHouse password: ")
                 if password:
                     config['clickhouse_password'] = password
                     break
@@ -128,21 +136,27 @@ def configure(context: Optional[str]) -> Dict[str, Any]:
     _retry_on_interrupt(_step_required_config, "Step 3: Required Configuration")
 
     # Step 4: Storage Configuration
-    _retry_on_interrupt(_configure_storage, "Step 4: Storage Configuration", config, context)
+    _retry_on_interrupt(_configure_storage, "Step 4: Storage Configuration", config, context, probes)
     
     # Step 5: Advanced Configuration
     _retry_on_interrupt(_configure_advanced, "Step 5: Advanced Configuration", config)
 
+    executor.shutdown(wait=False)
     return config
 
 
-def _configure_storage(config: Dict[str, Any], context: Optional[str]) -> None:
+def _configure_storage(
+    config: Dict[str, Any],
+    context: Optional[str],
+    probes: Dict[str, Future]
+) -> None:
     """
     Configure storage buckets and credentials.
     
     Args:
         config: Configuration dictionary (modified in place)
         context: kubectl context name
+        probes: Background probe futures started in Step 2
     """
     print_section("Step 4: Storage Buckets")
     
@@ -150,7 +164,7 @@ def _configure_storage(config: Dict[str, Any], context: Optional[str]) -> None:
     use_existing = False
     
     # Check cloud CLI availability upfront (needed in multiple paths)
-    has_cloud_cli = check_cloud_cli(config['cloud_provider'])
+    has_cloud_cli = probes['has_cloud_cli'].result()
     
     if existing_buckets:
         print_success("Found existing bucket configuration in laminar.yaml:")
@@ -177,7 +191,7 @@ def _configure_storage(config: Dict[str, Any], context: Optional[str]) -> None:
                 )
                 if not config['s3_use_env_creds']:
                     config['s3_access_key'] = get_input("Access Key ID", required=True)
-                    config['s3_secret_key'] = getpass.getpass("Secret Access Key: ")
+                    config['s3_secret_key'] = get_secret("Secret Access Key: ")
     
     if not use_existing:
         print_info("Laminar Data Plane can use cloud object storage (S3 / GCS) for:")
@@ -206,7 +220,7 @@ def _configure_storage(config: Dict[str, Any], context: Optional[str]) -> None:
             )
             if not config['s3_use_env_creds']:
                 config['s3_access_key'] = get_input("Access Key ID", required=True)
-                config['s3_secret_key'] = getpass.getpass("Secret Access Key: ")
+                config['s3_secret_key'] = get_secret("Secret Access Key: ")
 
             bucket_suffix = generate_bucket_suffix()
             ch_bucket_default = existing_buckets.get('ch_bucket', f"lmnr-clickhouse-data-{bucket_suffix}")
@@ -229,20 +243,21 @@ def _configure_storage(config: Dict[str, Any], context: Optional[str]) -> None:
         _setup_cloud_permissions(config, has_cloud_cli)
     
     # Auto-detect and configure storage class (always do this)
-    _configure_storage_class(config)
+    _configure_storage_class(config, probes['storage_class'])
 
 
-def _configure_storage_class(config: Dict[str, Any]) -> None:
+def _configure_storage_class(config: Dict[str, Any], storage_class_probe: Future) -> None:
     """
     Configure storage class for ClickHouse persistent volume.
     
     Args:
         config: Configuration dictionary (modified in place)
+        storage_class_probe: Background get_recommended_storage_class() call
     """
     print()
     print_section("Step 4c: ClickHouse Persistent Storage")
     
-    recommended_sc = get_recommended_storage_class(config['cloud_provider'])
+    recommended_sc = storage_class_probe.result()
     if recommended_sc:
         print_success(f"Detected storage class: {recommended_sc}")
         config['ch_storage_class'] = recommended_sc
@@ -275,15 +290,28 @@ def _setup_cloud_permissions(config: Dict[str, Any], has_cloud_cli: bool) -> Non
         print_info("Setting up AWS IAM permissions for S3 access...")
         print_info(f"Buckets: {', '.join(buckets_to_grant)}")
         print()
-        auto_setup = get_yes_no(
-            "Automatically attach S3 policy to node group IAM role?",
-            default=True
+        # Look up the node group role while the user answers the prompt; its
+        # result is only awaited if they accept, so declining (or Ctrl-C)
+        # doesn't block on the aws calls
+        executor = ThreadPoolExecutor(max_workers=1)
+        role_lookup = executor.submit(
+            get_eks_nodegroup_role,
+            config['cluster_name'],
+            config['region']
         )
+        try:
+            auto_setup = get_yes_no(
+                "Automatically attach S3 policy to node group IAM role?",
+                default=True
+            )
+        finally:
+            executor.shutdown(wait=False)
         if auto_setup:
             success = setup_aws_iam_policy(
                 config['cluster_name'],
                 buckets_to_grant,
-                config['region']
+                config['region'],
+                role_lookup=role_lookup
             )
             if not success:
                 print_warning("IAM policy attachment failed. You may need to configure manually.")
@@ -320,7 +348,7 @@ def _setup_cloud_permissions(config: Dict[str, Any], has_cloud_cli: bool) -> Non
                     print()
                     print_info("Please provide existing HMAC credentials:")
                     config['gcs_access_key_id'] = get_input("HMAC Access Key ID", required=True)
-                    config['gcs_secret_key'] = getpass.getpass("HMAC Secret: ")
+                    config['gcs_secret_key'] = get_secret("HMAC Secret: ")
                     config['s3_use_env_creds'] = False
         else:
             print_info("Skipping automatic HMAC key creation.")
@@ -329,7 +357,7 @@ def _setup_cloud_permissions(config: Dict[str, Any], has_cloud_cli: bool) -> Non
             use_existing = get_yes_no("Do you have existing HMAC keys to provide now?", default=False)
             if use_existing:
                 config['gcs_access_key_id'] = get_input("HMAC Access Key ID", required=True)
-                config['gcs_secret_key'] = getpass.getpass("HMAC Secret: ")
+                config['gcs_secret_key'] = get_secret("HMAC Secret: ")
                 config['s3_use_env_creds'] = False
             else:
                 print_warning("You'll need to provide HMAC keys before ClickHouse can start.")
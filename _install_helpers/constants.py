@@ -1,21 +1,25 @@
 """Constants and configuration values for the installer."""
 
+import sys
 from pathlib import Path
 
-# ANSI color codes for terminal output
-BOLD = '\033[1m'
-GREEN = '\033[92m'
-BLUE = '\033[94m'
-YELLOW = '\033[93m'
-RED = '\033[91m'
-RESET = '\033[0m'
-CYAN = '\033[96m'
+# ANSI color codes for terminal output; empty when stdout is not a terminal
+# (CI logs, pipes) so captured output stays plain text
+_USE_COLOR = sys.stdout.isatty()
+BOLD = '\033[1m' if _USE_COLOR else ''
+GREEN = '\033[92m' if _USE_COLOR else ''
+BLUE = '\033[94m' if _USE_COLOR else ''
+YELLOW = '\033[93m' if _USE_COLOR else ''
+RED = '\033[91m' if _USE_COLOR else ''
+RESET = '\033[0m' if _USE_COLOR else ''
+CYAN = '\033[96m' if _USE_COLOR else ''
 
 # Installation configuration
 RELEASE_NAME = 'laminar-dataplane'
 LB_SERVICE_NAME = 'laminar-data-plane-proxy-lb'
 CHART_DIR = str(Path(__file__).resolve().parent.parent)
 VALUES_FILE = Path(CHART_DIR) / 'laminar.yaml'
+VALUES_FILE_STR = str(VALUES_FILE)
 
 # Default values
 DEFAULT_AWS_REGION = 'us-east-1'
@@ -33,6 +37,10 @@ DEFAULT_LB_PORT = '40080'
 LB_MAX_ATTEMPTS = 30
 LB_INITIAL_WAIT = 2
 LB_MAX_WAIT = 10
+LB_WATCH_TIMEOUT = LB_MAX_ATTEMPTS * LB_MAX_WAIT  # seconds
+
+# Concurrency
+MAX_PARALLEL_CLI_CALLS = 8  # upper bound on concurrent cloud CLI processes
 
 # Security
 PASSWORD_LENGTH = 64  # hex characters for ClickHouse password
@@ -1,14 +1,108 @@
 """Helm operations and LoadBalancer management."""
 
+import atexit
+import random
 import subprocess
 import sys
+import threading
 import time
-from typing import Optional, List
+from concurrent.futures import Future, InvalidStateError
+from contextlib import suppress
+from functools import lru_cache
+from typing import Dict, Optional, List, Tuple
 from .constants import (
-    RELEASE_NAME, CHART_DIR, VALUES_FILE, LB_SERVICE_NAME,
-    LB_MAX_ATTEMPTS, LB_INITIAL_WAIT, LB_MAX_WAIT
+    RELEASE_NAME, CHART_DIR, VALUES_FILE_STR, LB_SERVICE_NAME,
+    LB_MAX_ATTEMPTS, LB_INITIAL_WAIT, LB_MAX_WAIT, LB_WATCH_TIMEOUT
 )
-from .ui import print_info, print_section
+from .ui import print_info, print_section, print_warning
+
+# The kubernetes client is optional - when available, cluster reads reuse one
+# authenticated API client instead of spawning kubectl (which re-reads the
+# kubeconfig and re-authenticates) for every call
+try:
+    from kubernetes import client as k8s_client
+    from kubernetes import config as k8s_config
+    from kubernetes import watch as k8s_watch
+    from kubernetes.client.exceptions import ApiException
+    from kubernetes.config.config_exception import ConfigException
+    from urllib3.exceptions import HTTPError as Urllib3HTTPError
+    # API errors plus transport failures (unreachable server, dropped watch)
+    K8S_API_ERRORS = (ApiException, Urllib3HTTPError)
+    KUBERNETES_SDK_AVAILABLE = True
+except ImportError:
+    KUBERNETES_SDK_AVAILABLE = False
+
+# Invariant part of the install/upgrade argv; only the namespace varies
+HELM_UPGRADE_CMD = (
+    'helm', 'upgrade', '--install',
+    RELEASE_NAME,
+    CHART_DIR,
+    '--create-namespace',
+    '-f', VALUES_FILE_STR,
+)
+
+# Label selectors of the pods that must be ready after install/upgrade
+POD_READY_SELECTORS = (
+    'app.kubernetes.io/name=laminar-clickhouse',
+    'app.kubernetes.io/name=laminar-data-plane-proxy',
+)
+POD_READY_TIMEOUT = 300  # seconds
+POD_RETRY_DELAY = 2  # seconds before re-watching pods after the stream ends early
+
+# Renders "<hostname> <ip>" on one line (missing fields render empty), so a
+# single kubectl call or watch event yields both ingress fields
+LB_INGRESS_JSONPATH = (
+    '{.status.loadBalancer.ingress[0].hostname}{" "}'
+    '{.status.loadBalancer.ingress[0].ip}{"\\n"}'
+)
+
+
+def _parse_ingress_line(text: str) -> Optional[str]:
+    """Return the first hostname or IP in LB_INGRESS_JSONPATH output, if any."""
+    for value in text.split():
+        if value != '<none>' and value != 'null':
+            return value
+    return None
+
+
+# Serializes the first _get_core_api() call: the LoadBalancer lookup and the
+# pod wait start together, and lru_cache alone would let both load the
+# kubeconfig (running any exec credential plugin twice)
+_core_api_lock = threading.Lock()
+
+
+def _get_core_api():
+    """
+    Return a cached CoreV1Api for the current kubeconfig context.
+    
+    Safe to call from several threads; the kubeconfig is loaded only once.
+    
+    Returns:
+        CoreV1Api instance, or None if the kubernetes client is not installed
+        or the kubeconfig cannot be loaded
+    """
+    with _core_api_lock:
+        return _load_core_api()
+
+
+@lru_cache(maxsize=1)
+def _load_core_api():
+    """Load the kubeconfig and build a CoreV1Api; see _get_core_api()."""
+    if not KUBERNETES_SDK_AVAILABLE:
+        return None
+    try:
+        k8s_config.load_kube_config()
+    except (ConfigException, OSError):
+        return None
+    return k8s_client.CoreV1Api()
+
+
+def _service_ingress_address(service) -> Optional[str]:
+    """Return the first LoadBalancer ingress hostname or IP of a V1Service."""
+    ingress = service.status.load_balancer.ingress if service.status.load_balancer else None
+    if not ingress:
+        return None
+    return ingress[0].hostname or ingress[0].ip
 
 
 def build_helm_cmd(namespace: str) -> List[str]:
@@ -21,14 +115,7 @@ def build_helm_cmd(namespace: str) -> List[str]:
     Returns:
         Command as list of strings
     """
-    return [
-        'helm', 'upgrade', '--install',
-        RELEASE_NAME,
-        CHART_DIR,
-        '--namespace', namespace,
-        '--create-namespace',
-        '-f', str(VALUES_FILE),
-    ]
+    return [*HELM_UPGRADE_CMD, '--namespace', namespace]
 
 
 def run_helm(args: List[str]) -> int:
@@ -46,6 +133,101 @@ def run_helm(args: List[str]) -> int:
     return result.returncode
 
 
+def _pod_is_ready(pod) -> bool:
+    """Return True if a V1Pod reports the Ready condition."""
+    conditions = (pod.status.conditions if pod.status else None) or []
+    return any(c.type == 'Ready' and c.status == 'True' for c in conditions)
+
+
+def _describe_api_error(error: Exception) -> str:
+    """Summarize a kubernetes client error on one line."""
+    if isinstance(error, ApiException):
+        return f"API error {error.status} {error.reason}"
+    return f"{type(error).__name__}: {error}"
+
+
+def _watch_selector_ready(core, namespace: str, selector: str, deadline: float) -> bool:
+    """
+    List the pods matching a selector, then watch them until all are Ready.
+    
+    Args:
+        core: CoreV1Api instance
+        namespace: Kubernetes namespace
+        selector: Label selector of the pods to wait for
+        deadline: time.monotonic() value at which to give up
+        
+    Returns:
+        True if at least one pod matched and all are Ready, False if the
+        watch ended first
+        
+    Raises:
+        Any of K8S_API_ERRORS on API or transport failures
+    """
+    pods = core.list_namespaced_pod(namespace, label_selector=selector)
+    ready: Dict[str, bool] = {pod.metadata.name: _pod_is_ready(pod) for pod in pods.items}
+    if ready and all(ready.values()):
+        return True
+    timeout = int(deadline - time.monotonic())
+    if timeout <= 0:
+        return False
+    
+    watcher = k8s_watch.Watch()
+    try:
+        for event in watcher.stream(
+            core.list_namespaced_pod,
+            namespace,
+            label_selector=selector,
+            resource_version=pods.metadata.resource_version,
+            timeout_seconds=timeout
+        ):
+            # Watch.stream yields None for blank keep-alive lines
+            if event is None:
+                continue
+            pod = event['object']
+            if event['type'] == 'DELETED':
+                ready.pop(pod.metadata.name, None)
+            else:
+                ready[pod.metadata.name] = _pod_is_ready(pod)
+            if ready and all(ready.values()):
+                return True
+        return False
+    finally:
+        watcher.stop()
+
+
+def _wait_for_selector_ready_sdk(core, namespace: str, selector: str, deadline: float) -> Tuple[bool, str]:
+    """
+    Block until every pod matching a label selector is Ready.
+    
+    Lists the pods, then watches from that resourceVersion so the wait
+    returns as soon as the last pod turns Ready instead of at a poll tick.
+    If the watch ends early (e.g. dropped by an API proxy or a transport
+    error), the pods are listed and watched again until the deadline.
+    
+    Args:
+        core: CoreV1Api instance
+        namespace: Kubernetes namespace
+        selector: Label selector of the pods to wait for
+        deadline: time.monotonic() value at which to give up
+        
+    Returns:
+        Tuple of (ready, reason), where reason describes why the pods are
+        not ready
+    """
+    while True:
+        try:
+            if _watch_selector_ready(core, namespace, selector, deadline):
+                return True, ''
+            reason = 'timed out'
+        except K8S_API_ERRORS as e:
+            reason = _describe_api_error(e)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False, reason
+        # Back off briefly so a flapping stream or erroring server isn't hammered
+        time.sleep(min(POD_RETRY_DELAY, remaining))
+
+
 def wait_for_pods_ready(namespace: str) -> bool:
     """
     Wait for all Laminar pods to be ready.
@@ -59,72 +241,236 @@ def wait_for_pods_ready(namespace: str) -> bool:
     print_section("Waiting for Pods to be Ready")
     print_info("Waiting for ClickHouse and Data Plane Proxy to start (up to 5 minutes)...")
     
-    try:
-        # Wait for ClickHouse StatefulSet
-        subprocess.run(
+    core = _get_core_api()
+    if core is not None:
+        # ClickHouse and the proxy start concurrently, so by the time the first
+        # selector is Ready the second is usually close; share one deadline
+        deadline = time.monotonic() + POD_READY_TIMEOUT
+        all_ready = True
+        for selector in POD_READY_SELECTORS:
+            ready, reason = _wait_for_selector_ready_sdk(core, namespace, selector, deadline)
+            if not ready:
+                all_ready = False
+                print_warning(f"Pods not ready ({selector}): {reason}")
+        return all_ready
+    
+    # ClickHouse and the proxy start concurrently, so wait on both at once
+    procs = [
+        subprocess.Popen(
             [
                 'kubectl', 'wait', '--for=condition=ready',
-                'pod', '-l', 'app.kubernetes.io/name=laminar-clickhouse',
+                'pod', '-l', selector,
                 '-n', namespace,
-                '--timeout=300s'
+                f'--timeout={POD_READY_TIMEOUT}s'
             ],
-            check=True
+            stderr=subprocess.PIPE, text=True
         )
+        for selector in POD_READY_SELECTORS
+    ]
+    
+    all_ready = True
+    for selector, proc in zip(POD_READY_SELECTORS, procs):
+        _, stderr = proc.communicate()
+        if proc.returncode != 0:
+            all_ready = False
+            print_warning(f"Pods not ready ({selector}): {stderr.strip()}")
+    
+    return all_ready
+
+
+def _watch_load_balancer_url(namespace: str, timeout: int, lookup: Optional[Future] = None) -> Optional[str]:
+    """
+    Stream LoadBalancer status updates with a single watch.
+    
+    Uses the kubernetes client when available, otherwise 'kubectl get --watch'.
+    
+    Args:
+        namespace: Kubernetes namespace
+        timeout: Maximum number of seconds to watch
+        lookup: Background lookup this watch belongs to; cancelling it kills
+            the kubectl watch
         
-        # Wait for Data Plane Proxy Deployment
-        subprocess.run(
+    Returns:
+        LoadBalancer hostname or IP, or None if the watch ended without one
+    """
+    core = _get_core_api()
+    if core is not None:
+        watcher = k8s_watch.Watch()
+        try:
+            for event in watcher.stream(
+                core.list_namespaced_service,
+                namespace,
+                field_selector=f'metadata.name={LB_SERVICE_NAME}',
+                timeout_seconds=timeout
+            ):
+                # Watch.stream yields None for blank keep-alive lines
+                if event is None:
+                    continue
+                address = _service_ingress_address(event['object'])
+                if address:
+                    return address
+            return None
+        except K8S_API_ERRORS:
+            return None
+        finally:
+            watcher.stop()
+    
+    try:
+        proc = subprocess.Popen(
             [
-                'kubectl', 'wait', '--for=condition=ready',
-                'pod', '-l', 'app.kubernetes.io/name=laminar-data-plane-proxy',
+                'kubectl', 'get', 'svc', LB_SERVICE_NAME,
                 '-n', namespace,
-                '--timeout=300s'
+                '--watch',
+                '-o', f'jsonpath={LB_INGRESS_JSONPATH}'
             ],
-            check=True
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
         )
+    except FileNotFoundError:
+        return None
+    
+    timer = threading.Timer(timeout, proc.kill)
+    timer.daemon = True
+    timer.start()
+    if lookup is not None:
+        lookup.add_done_callback(lambda _: proc.kill())
+    try:
+        for line in proc.stdout:
+            address = _parse_ingress_line(line)
+            if address:
+                return address
+        return None
+    finally:
+        timer.cancel()
+        proc.kill()
+        proc.wait()
+
+
+def _read_load_balancer_url(namespace: str) -> Optional[str]:
+    """
+    Read the LoadBalancer external address once.
+    
+    Args:
+        namespace: Kubernetes namespace
         
-        return True
+    Returns:
+        LoadBalancer hostname or IP, or None if not assigned yet
+    """
+    core = _get_core_api()
+    if core is not None:
+        try:
+            return _service_ingress_address(
+                core.read_namespaced_service(LB_SERVICE_NAME, namespace)
+            )
+        except K8S_API_ERRORS:
+            return None
+    
+    try:
+        result = subprocess.run(
+            [
+                'kubectl', 'get', 'svc', LB_SERVICE_NAME,
+                '-n', namespace,
+                '-o', f'jsonpath={LB_INGRESS_JSONPATH}'
+            ],
+            capture_output=True, text=True, check=True
+        )
     except subprocess.CalledProcessError:
-        return False
+        return None
+    return _parse_ingress_line(result.stdout)
 
 
-def get_load_balancer_url(namespace: str) -> Optional[str]:
+def _resolve_load_balancer_url(namespace: str, lookup: Optional[Future] = None) -> Optional[str]:
     """
-    Attempt to retrieve the LoadBalancer external URL via kubectl.
+    Wait for the LoadBalancer external address to be assigned.
     
-    Polls the LoadBalancer service until an external IP/hostname is assigned,
-    or until the maximum number of attempts is reached.
+    Watches the LoadBalancer service until an external IP/hostname is assigned.
+    If the watch stream ends early (e.g. dropped by an API proxy), falls back
+    to polling with jittered exponential backoff until the same deadline or
+    the maximum number of attempts is reached.
     
     Args:
         namespace: Kubernetes namespace
+        lookup: Background lookup being resolved, if any; progress is only
+            printed when running in the foreground
         
     Returns:
         LoadBalancer URL (hostname or IP) or None if not available
     """
-    print_section("Retrieving LoadBalancer URL")
-    print_info("Waiting for LoadBalancer to be provisioned (this can take 1-3 minutes)...")
+    deadline = time.monotonic() + LB_WATCH_TIMEOUT
+    url = _watch_load_balancer_url(namespace, LB_WATCH_TIMEOUT, lookup)
+    if url:
+        return url
+    if time.monotonic() >= deadline:
+        return None
 
     for attempt in range(1, LB_MAX_ATTEMPTS + 1):
-        for field in ['hostname', 'ip']:
-            try:
-                result = subprocess.run(
-                    [
-                        'kubectl', 'get', 'svc', LB_SERVICE_NAME,
-                        '-n', namespace,
-                        '-o', f'jsonpath={{.status.loadBalancer.ingress[0].{field}}}'
-                    ],
-                    capture_output=True, text=True, check=True
-                )
-                value = result.stdout.strip()
-                if value and value != '<none>' and value != 'null':
-                    return value
-            except subprocess.CalledProcessError:
-                pass
-
-        if attempt < LB_MAX_ATTEMPTS:
-            wait = min(LB_MAX_WAIT, LB_INITIAL_WAIT + attempt)
-            sys.stdout.write(f"\r  Attempt {attempt}/{LB_MAX_ATTEMPTS} - waiting {wait}s...")
-            sys.stdout.flush()
+        if lookup is not None and lookup.cancelled():
+            return None
+        url = _read_load_balancer_url(namespace)
+        if url:
+            return url
+
+        remaining = deadline - time.monotonic()
+        if attempt < LB_MAX_ATTEMPTS and remaining > 0:
+            backoff = min(LB_MAX_WAIT, LB_INITIAL_WAIT * 2 ** (attempt - 1))
+            wait = min(remaining, backoff * random.uniform(0.8, 1.2))
+            if lookup is None:
+                sys.stdout.write(f"\r  Attempt {attempt}/{LB_MAX_ATTEMPTS} - waiting {wait:.0f}s...")
+                sys.stdout.flush()
             time.sleep(wait)
+        else:
+            break
 
-    print()
+    if lookup is None:
+        print()
     return None
+
+
+def start_load_balancer_lookup(namespace: str) -> Future:
+    """
+    Start resolving the LoadBalancer URL in a background thread.
+    
+    Provisioning begins as soon as helm applies the Service, so the lookup can
+    overlap the pod readiness wait. Cancelling the returned future (which also
+    happens at interpreter exit) stops any running kubectl watch.
+    
+    Args:
+        namespace: Kubernetes namespace
+        
+    Returns:
+        Future resolving to the LoadBalancer URL or None; pass it to
+        get_load_balancer_url()
+    """
+    lookup: Future = Future()
+    
+    def resolve() -> None:
+        # set_* raise InvalidStateError if the lookup was cancelled meanwhile
+        with suppress(InvalidStateError):
+            try:
+                url = _resolve_load_balancer_url(namespace, lookup)
+            except Exception as e:
+                lookup.set_exception(e)
+            else:
+                lookup.set_result(url)
+    
+    atexit.register(lookup.cancel)
+    threading.Thread(target=resolve, daemon=True).start()
+    return lookup
+
+
+def get_load_balancer_url(namespace: str, lookup: Optional[Future] = None) -> Optional[str]:
+    """
+    Attempt to retrieve the LoadBalancer external URL.
+    
+    Args:
+        namespace: Kubernetes namespace
+        lookup: Pending result of start_load_balancer_lookup(), if already started
+        
+    Returns:
+        LoadBalancer URL (hostname or IP) or None if not available
+    """
+    print_section("Retrieving LoadBalancer URL")
+    print_info("Waiting for LoadBalancer to be provisioned (this can take 1-3 minutes)...")
+
+    if lookup is not None:
+        return lookup.result()
+    return _resolve_load_balancer_url(namespace)
@@ -1,22 +1,37 @@
 """Utilities for collecting user input."""
 
 from typing import Optional, List
-import secrets
+import binascii
+import os
+import sys
 from .ui import print_error
 from .constants import PASSWORD_LENGTH, BUCKET_SUFFIX_LENGTH
 
-# Import readline for better input handling (arrow keys, history)
-# This is optional - if not available, input() will still work
-try:
-    import readline
-    # Enable tab completion and history
-    readline.parse_and_bind('tab: complete')
-    # Set history file size
-    readline.set_history_length(1000)
-    READLINE_AVAILABLE = True
-except ImportError:
-    # readline not available on some platforms (e.g., Windows without pyreadline)
-    READLINE_AVAILABLE = False
+# readline gives input() arrow-key editing and history. It is optional (not
+# available on some platforms, e.g. Windows without pyreadline) and only
+# useful for interactive terminals, so it is loaded on the first prompt.
+READLINE_AVAILABLE = False
+_readline_initialized = False
+
+
+def _ensure_readline() -> None:
+    """Load and configure readline on first use when stdin is a terminal."""
+    global READLINE_AVAILABLE, _readline_initialized
+    if _readline_initialized:
+        return
+    _readline_initialized = True
+    
+    if not sys.stdin.isatty():
+        return
+    try:
+        import readline
+        # Enable tab completion and history
+        readline.parse_and_bind('tab: complete')
+        # Set history file size
+        readline.set_history_length(1000)
+        READLINE_AVAILABLE = True
+    except ImportError:
+        pass
 
 
 def get_input(prompt: str, default: Optional[str] = None, required: bool = False) -> str:
@@ -31,6 +46,7 @@ def get_input(prompt: str, default: Optional[str] = None, required: bool = False
     Returns:
         The user's input or default value
     """
+    _ensure_readline()
     display_prompt = f"{prompt} [{default}]: " if default else f"{prompt}: "
     
     while True:
@@ -44,6 +60,23 @@ def get_input(prompt: str, default: Optional[str] = None, required: bool = False
             return value
 
 
+def get_secret(prompt: str) -> str:
+    """
+    Get a secret value from the user without echoing it.
+    
+    getpass is imported on first use since most installs never prompt for
+    a secret (passwords and keys are usually generated or detected).
+    
+    Args:
+        prompt: The prompt to display to the user
+        
+    Returns:
+        The entered secret
+    """
+    import getpass
+    return getpass.getpass(prompt)
+
+
 def get_yes_no(prompt: str, default: bool = True) -> bool:
     """
     Get a yes/no response from the user.
@@ -55,6 +88,7 @@ def get_yes_no(prompt: str, default: bool = True) -> bool:
     Returns:
         True for yes, False for no
     """
+    _ensure_readline()
     default_str = "Y/n" if default else "y/N"
     while True:
         response = input(f"{prompt} ({default_str}): ").strip().lower()
@@ -78,9 +112,9 @@ def get_choice(prompt: str, options: List[str]) -> int:
     Returns:
         Zero-based index of the chosen option
     """
-    print(f"\n{prompt}")
-    for i, option in enumerate(options, 1):
-        print(f"  {i}. {option}")
+    _ensure_readline()
+    # Render the whole menu in a single write
+    print("\n".join([f"\n{prompt}"] + [f"  {i}. {option}" for i, option in enumerate(options, 1)]))
     
     while True:
         choice = input(f"\nEnter 1-{len(options)}: ").strip()
@@ -95,7 +129,7 @@ def get_choice(prompt: str, options: List[str]) -> int:
 
 def generate_secure_password(length: int = PASSWORD_LENGTH) -> str:
     """Generate a cryptographically secure random password."""
-    return secrets.token_hex(length)
+    return binascii.hexlify(os.urandom(length)).decode('ascii')
 
 
 def get_int_input(prompt: str, default: Optional[int] = None, min_value: Optional[int] = None, max_value: Optional[int] = None) -> int:
@@ -136,4 +170,4 @@ def get_int_input(prompt: str, default: Optional[int] = None, min_value: Optiona
 
 def generate_bucket_suffix(length: int = BUCKET_SUFFIX_LENGTH) -> str:
     """Generate a random suffix for bucket names to ensure global uniqueness."""
-    return secrets.token_hex(length)
+    return binascii.hexlify(os.urandom(length)).decode('ascii')
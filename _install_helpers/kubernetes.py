@@ -2,22 +2,80 @@
 
 import json
 import subprocess
-from typing import Optional, List, Tuple
+from functools import lru_cache
+from typing import Optional, Tuple
 
+# Storage class name substrings preferred per cloud provider, best first:
+# AWS gp3 > gp2, GCP pd-ssd > standard-rwo
+STORAGE_CLASS_PREFERENCES = {
+    'aws': ('gp3', 'gp2'),
+    'gcp': ('ssd', 'standard'),
+}
 
-def get_storage_classes() -> List[Tuple[str, bool]]:
+
+# Annotations that mark a StorageClass as the cluster default
+_DEFAULT_KEYS = (
+    'storageclass.kubernetes.io/is-default-class',
+    'storageclass.beta.kubernetes.io/is-default-class',
+)
+
+# Project only the name and the default-class annotations server-side so
+# we never download (or decode) full StorageClass objects. Dots inside the
+# annotation keys must be escaped in the column paths.
+STORAGE_CLASS_COLUMNS_CMD = (
+    'kubectl', 'get', 'storageclass', '--no-headers', '-o',
+    'custom-columns=NAME:.metadata.name,' + ','.join(
+        f'DEFAULT{i}:.metadata.annotations.' + key.replace('.', '\\.')
+        for i, key in enumerate(_DEFAULT_KEYS, 1)
+    ),
+)
+
+
+def _get_storage_classes_columns() -> Optional[Tuple[Tuple[str, bool], ...]]:
     """
-    Get available storage classes from the cluster.
+    Read storage classes via kubectl custom-columns output.
     
     Returns:
-        List of tuples (storage_class_name, is_default)
+        Tuple of (storage_class_name, is_default) tuples (empty if kubectl
+        failed), or None if the output could not be parsed
     """
     try:
         result = subprocess.run(
-            ['kubectl', 'get', 'storageclass', '-o', 'json'],
+            STORAGE_CLASS_COLUMNS_CMD,
             capture_output=True,
             text=True,
-            check=True
+            check=True,
+            start_new_session=True
+        )
+    except subprocess.CalledProcessError:
+        # Unreachable or forbidden cluster; the JSON listing would fail too
+        return ()
+    
+    storage_classes = []
+    for line in result.stdout.splitlines():
+        fields = line.split()
+        if not fields:
+            continue
+        if len(fields) != 1 + len(_DEFAULT_KEYS):
+            return None
+        name, *defaults = fields
+        storage_classes.append((name, 'true' in defaults))
+    return tuple(storage_classes)
+
+
+def _get_storage_classes_json() -> Tuple[Tuple[str, bool], ...]:
+    """
+    Read storage classes from full kubectl JSON output.
+    
+    Returns:
+        Tuple of (storage_class_name, is_default) tuples
+    """
+    try:
+        result = subprocess.run(
+            ['kubectl', 'get', 'storageclass', '-o', 'json'],
+            capture_output=True,
+            check=True,
+            start_new_session=True
         )
         
         data = json.loads(result.stdout)
@@ -26,16 +84,38 @@ def get_storage_classes() -> List[Tuple[str, bool]]:
         for item in data.get('items', []):
             name = item['metadata']['name']
             # Check if it's marked as default
-            annotations = item['metadata'].get('annotations', {})
-            is_default = (
-                annotations.get('storageclass.kubernetes.io/is-default-class') == 'true' or
-                annotations.get('storageclass.beta.kubernetes.io/is-default-class') == 'true'
-            )
+            annotations = item['metadata'].get('annotations') or {}
+            is_default = any(annotations.get(key) == 'true' for key in _DEFAULT_KEYS)
             storage_classes.append((name, is_default))
         
-        return storage_classes
+        return tuple(storage_classes)
     except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError):
-        return []
+        return ()
+
+
+@lru_cache(maxsize=1)
+def get_storage_classes() -> Tuple[Tuple[str, bool], ...]:
+    """
+    Get available storage classes from the cluster.
+    
+    The result is cached for the lifetime of the installer; use
+    refresh_storage_classes() to force a re-read. kubectl runs in its own
+    session because this is probed in the background during prompts, and a
+    Ctrl-C at the prompt must not kill it and cache an empty result.
+    
+    Returns:
+        Tuple of (storage_class_name, is_default) tuples
+    """
+    storage_classes = _get_storage_classes_columns()
+    if storage_classes is None:
+        # Unexpected column layout; fall back to the full JSON listing
+        storage_classes = _get_storage_classes_json()
+    return storage_classes
+
+
+def refresh_storage_classes() -> None:
+    """Drop the cached storage classes so the next lookup queries the cluster."""
+    get_storage_classes.cache_clear()
 
 
 def get_default_storage_class() -> Optional[str]:
@@ -67,31 +147,19 @@ def get_recommended_storage_class(cloud_provider: str) -> Optional[str]:
     if not storage_classes:
         return None
     
-    # First, check if there's a default
+    # Single pass: a cluster default wins outright, otherwise keep the
+    # earliest class matching the highest-priority substring
+    preferences = STORAGE_CLASS_PREFERENCES.get(cloud_provider, ())
+    best_rank = len(preferences)
+    best_name = None
     for name, is_default in storage_classes:
         if is_default:
             return name
-    
-    # No default, try cloud-specific recommendations
-    if cloud_provider == 'aws':
-        # Prefer gp3 > gp2 > first available
-        for name, _ in storage_classes:
-            if 'gp3' in name.lower():
-                return name
-        for name, _ in storage_classes:
-            if 'gp2' in name.lower():
-                return name
-    elif cloud_provider == 'gcp':
-        # Prefer pd-ssd > standard-rwo > first available
-        for name, _ in storage_classes:
-            if 'ssd' in name.lower():
-                return name
-        for name, _ in storage_classes:
-            if 'standard' in name.lower():
-                return name
+        lowered = name.lower()
+        for rank, substring in enumerate(preferences[:best_rank]):
+            if substring in lowered:
+                best_rank, best_name = rank, name
+                break
     
     # Return first available if no match
-    if storage_classes:
-        return storage_classes[0][0]
-    
-    return None
+    return best_name or storage_classes[0][0]
@@ -2,37 +2,70 @@
 
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional
 from .ui import print_error, print_info, print_section, print_success
 
+# (command, display name, install hint) for each required tool
+REQUIRED_TOOLS = (
+    ('kubectl', 'kubectl', 'Install from https://kubernetes.io/docs/tasks/tools/'),
+    ('helm', 'Helm', 'Install from https://helm.sh/docs/intro/install/'),
+)
 
-def check_command(cmd: str, name: str, install_hint: str) -> bool:
-    """
-    Check if a command-line tool is available.
-    
-    Args:
-        cmd: Command to check
-        name: Human-readable name of the tool
-        install_hint: Installation instructions
-        
-    Returns:
-        True if command is available, False otherwise
-    """
+
+def _is_command_available(cmd: str) -> bool:
+    """Run the tool's version command without printing anything."""
     try:
         version_args = [cmd, 'version'] if cmd == 'helm' else [cmd, 'version', '--client']
-        subprocess.run(version_args, capture_output=True, check=True)
-        print_success(f"{name} is installed")
+        subprocess.run(
+            version_args,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True
+        )
         return True
     except (subprocess.CalledProcessError, FileNotFoundError):
+        return False
+
+
+def _get_current_context() -> Optional[str]:
+    """Return the current kubectl context without printing anything."""
+    try:
+        result = subprocess.run(
+            ['kubectl', 'config', 'current-context'],
+            capture_output=True, text=True, check=True
+        )
+        return result.stdout.strip()
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+
+
+def _report_command(available: bool, name: str, install_hint: str) -> bool:
+    """Print the outcome of a tool availability check."""
+    if available:
+        print_success(f"{name} is installed")
+    else:
         print_error(f"{name} is not installed or not in PATH")
         print_info(install_hint)
-        return False
+    return available
 
 
+def _report_context(context: Optional[str]) -> Optional[str]:
+    """Print the outcome of the kubectl context check."""
+    if context:
+        print_success(f"kubectl context: {context}")
+    else:
+        print_error("No kubectl context configured")
+        print_info("Run 'kubectl config use-context <context>' to set one")
+    return context
+
+
+@lru_cache(maxsize=None)
 def check_cloud_cli(cloud_provider: str) -> bool:
     """
     Check if the cloud CLI (aws or gsutil) is available.
     
+    The result is cached per provider, so retried sections don't re-probe.
+    
     Args:
         cloud_provider: Either 'aws' or 'gcp'
         
@@ -40,40 +73,26 @@ def check_cloud_cli(cloud_provider: str) -> bool:
         True if CLI is available, False otherwise
     """
     try:
-        if cloud_provider == 'aws':
-            subprocess.run(['aws', '--version'], capture_output=True, check=True)
-        else:
-            subprocess.run(['gsutil', 'version'], capture_output=True, check=True)
+        cmd = ['aws', '--version'] if cloud_provider == 'aws' else ['gsutil', 'version']
+        # Runs in the background while the user is at a prompt; a separate
+        # session keeps Ctrl-C from killing the probe and caching a false result
+        subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True,
+            start_new_session=True
+        )
         return True
     except (subprocess.CalledProcessError, FileNotFoundError):
         return False
 
 
-def check_kubectl_context() -> Optional[str]:
-    """
-    Verify kubectl has a valid context configured.
-    
-    Returns:
-        The current context name, or None if not configured
-    """
-    try:
-        result = subprocess.run(
-            ['kubectl', 'config', 'current-context'],
-            capture_output=True, text=True, check=True
-        )
-        context = result.stdout.strip()
-        print_success(f"kubectl context: {context}")
-        return context
-    except subprocess.CalledProcessError:
-        print_error("No kubectl context configured")
-        print_info("Run 'kubectl config use-context <context>' to set one")
-        return None
-
-
 def check_prerequisites() -> str:
     """
     Verify all required tools are installed.
     
+    The tool and context probes are independent, so they run concurrently;
+    results are printed afterwards in a fixed order.
+    
     Returns:
         The kubectl context name
         
@@ -81,16 +100,21 @@ def check_prerequisites() -> str:
         SystemExit if prerequisites are not met
     """
     print_section("Checking Prerequisites")
-    ok = True
     
-    if not check_command('kubectl', 'kubectl', 'Install from https://kubernetes.io/docs/tasks/tools/'):
-        ok = False
-    if not check_command('helm', 'Helm', 'Install from https://helm.sh/docs/intro/install/'):
-        ok = False
+    with ThreadPoolExecutor(max_workers=len(REQUIRED_TOOLS) + 1) as executor:
+        tool_probes = [
+            executor.submit(_is_command_available, cmd) for cmd, _, _ in REQUIRED_TOOLS
+        ]
+        context_probe = executor.submit(_get_current_context)
+    
+    ok = True
+    for (_, name, install_hint), probe in zip(REQUIRED_TOOLS, tool_probes):
+        if not _report_command(probe.result(), name, install_hint):
+            ok = False
     
     context = None
     if ok:
-        context = check_kubectl_context()
+        context = _report_context(context_probe.result())
         if not context:
             ok = False
     
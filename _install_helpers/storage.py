@@ -1,12 +1,25 @@
 """Storage bucket operations for S3 and GCS."""
 
+import re
 import subprocess
 import sys
-from typing import Dict
+from typing import Any, Dict
+from urllib.parse import urlparse
 from .ui import print_error, print_info, print_success, print_warning
 from .input_utils import get_input, get_yes_no
 from .constants import VALUES_FILE
 
+# First 'enabled:' nested under an 's3:' key (deeper than its indent \g<i>)
+_S3_ENABLED_RE = re.compile(
+    r"""
+    ^(?P<i>[ \t]*)s3:[ \t]*(?:\#[^\r\n]*)?\r?\n
+    (?:(?:[ \t]*(?:\#[^\r\n]*)?|(?P=i)[ \t]+(?!enabled:)[^\s#][^\r\n]*)\r?\n)*?
+    (?P=i)[ \t]+enabled:[ \t]*["']?(?P<value>\w+)
+    """,
+    re.MULTILINE | re.VERBOSE
+)
+_ENDPOINT_RE = re.compile(r'^[ \t]+endpoint:[ \t]*["\']?(?P<url>[^"\'\s#]+)', re.MULTILINE)
+
 
 def create_bucket(cloud_provider: str, bucket_name: str, region: str) -> bool:
     """
@@ -56,7 +69,7 @@ def construct_s3_endpoint(cloud_provider: str, bucket_name: str, region: str) ->
         return f"https://storage.googleapis.com/{bucket_name}/data/"
 
 
-def parse_existing_buckets() -> Dict[str, any]:
+def parse_existing_buckets() -> Dict[str, Any]:
     """
     Parse existing laminar.yaml to extract bucket names.
     
@@ -68,23 +81,18 @@ def parse_existing_buckets() -> Dict[str, any]:
     
     existing = {}
     content = VALUES_FILE.read_text()
-    lines = content.splitlines()
     
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-        
-        if stripped.startswith('enabled:') and i > 0:
-            context_lines = lines[max(0, i-5):i]
-            if any('s3:' in context_line for context_line in context_lines):
-                if 'true' in stripped:
-                    existing['s3_enabled'] = True
-        
-        elif stripped.startswith('endpoint:') and i > 0:
-            value = stripped.split(':', 1)[1].strip().strip('"\'')
-            if value and ('s3.' in value or 'storage.googleapis.com' in value):
-                parts = value.split('/')
-                if len(parts) >= 4:
-                    existing['ch_bucket'] = parts[3]
+    match = _S3_ENABLED_RE.search(content)
+    if match and match.group('value').lower() == 'true':
+        existing['s3_enabled'] = True
+    
+    # Endpoint format: https://<s3 or GCS host>/<bucket>/data/
+    for match in _ENDPOINT_RE.finditer(content):
+        url = urlparse(match.group('url'))
+        if 's3.' in url.netloc or url.netloc == 'storage.googleapis.com':
+            parts = url.path.split('/')
+            if len(parts) > 1 and parts[1]:
+                existing['ch_bucket'] = parts[1]
     
     return existing
 
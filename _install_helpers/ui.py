@@ -1,50 +1,75 @@
 """User interface utilities for displaying formatted output."""
 
-from typing import Optional
+from typing import List, Optional
 from .constants import BOLD, BLUE, CYAN, GREEN, RED, YELLOW, RESET
 
+# Precomputed decorations so status helpers only concatenate the message
+_HEADER_RULE = f"{BOLD}{BLUE}{'='*70}{RESET}"
+_SECTION_RULE = f"{CYAN}{'─'*70}{RESET}"
+_FINAL_RULE = f"{BOLD}{GREEN}{'='*70}{RESET}"
+_SUCCESS_PREFIX = f"{GREEN}✓ "
+_ERROR_PREFIX = f"{RED}✗ "
+_WARNING_PREFIX = f"{YELLOW}⚠ "
+_INFO_PREFIX = f"{CYAN}ℹ "
+
+
+def print_block(lines: List[str]) -> None:
+    """Print several lines with a single write."""
+    print("\n".join(lines))
+
 
 def print_header(text: str) -> None:
     """Print a prominent header with decorative borders."""
-    print(f"\n{BOLD}{BLUE}{'='*70}{RESET}")
-    print(f"{BOLD}{BLUE}{text.center(70)}{RESET}")
-    print(f"{BOLD}{BLUE}{'='*70}{RESET}\n")
+    print_block([
+        f"\n{_HEADER_RULE}",
+        f"{BOLD}{BLUE}{text.center(70)}{RESET}",
+        f"{_HEADER_RULE}\n",
+    ])
 
 
 def print_section(text: str) -> None:
     """Print a section header with lighter decoration."""
-    print(f"\n{CYAN}{'─'*70}{RESET}")
-    print(f"{BOLD}{CYAN}{text}{RESET}")
-    print(f"{CYAN}{'─'*70}{RESET}\n")
+    print_block([
+        f"\n{_SECTION_RULE}",
+        f"{BOLD}{CYAN}{text}{RESET}",
+        f"{_SECTION_RULE}\n",
+    ])
 
 
 def print_success(text: str) -> None:
     """Print a success message with a checkmark."""
-    print(f"{GREEN}✓ {text}{RESET}")
+    print(_SUCCESS_PREFIX + text + RESET)
 
 
 def print_error(text: str) -> None:
     """Print an error message with an X mark."""
-    print(f"{RED}✗ {text}{RESET}")
+    print(_ERROR_PREFIX + text + RESET)
 
 
 def print_warning(text: str) -> None:
     """Print a warning message with a warning symbol."""
-    print(f"{YELLOW}⚠ {text}{RESET}")
+    print(_WARNING_PREFIX + text + RESET)
+
+
+def format_info(text: str) -> str:
+    """Format an informational message with an info symbol (for print_block)."""
+    return _INFO_PREFIX + text + RESET
 
 
 def print_info(text: str) -> None:
     """Print an informational message with an info symbol."""
-    print(f"{CYAN}ℹ {text}{RESET}")
+    print(format_info(text))
 
 
 def print_final_url(url: str, port: str) -> None:
     """Display the final LoadBalancer URL to the user."""
-    print(f"\n{BOLD}{GREEN}{'='*70}{RESET}")
-    print(f"{BOLD}{GREEN}  Laminar Data Plane is ready!{RESET}")
-    print(f"{BOLD}{GREEN}{'='*70}{RESET}")
-    print()
-    print(f"  {BOLD}Data Plane URL:{RESET}  {CYAN}http://{url}:{port}{RESET}")
-    print()
-    print("  Copy this URL and provide it to Laminar, or point a DNS record to it.")
-    print(f"\n{BOLD}{GREEN}{'='*70}{RESET}")
+    print_block([
+        f"\n{_FINAL_RULE}",
+        f"{BOLD}{GREEN}  Laminar Data Plane is ready!{RESET}",
+        _FINAL_RULE,
+        "",
+        f"  {BOLD}Data Plane URL:{RESET}  {CYAN}http://{url}:{port}{RESET}",
+        "",
+        "  Copy this URL and provide it to Laminar, or point a DNS record to it.",
+        f"\n{_FINAL_RULE}",
+    ])
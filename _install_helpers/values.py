@@ -1,10 +1,14 @@
 """Values file generation and management for Helm."""
 
-from typing import Dict, Any
+import re
+from typing import Dict, Any, Optional
 from .constants import VALUES_FILE
 from .yaml_utils import dict_to_yaml
 from .ui import print_success
 
+# The namespace is stored as a comment written by write_values_file_with_namespace
+_NAMESPACE_RE = re.compile(r'^# namespace:(?P<namespace>[^\r\n]*)', re.MULTILINE)
+
 
 def build_values(config: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -125,18 +129,24 @@ def write_values_file_with_namespace(values: Dict[str, Any], namespace: str) ->
     print_success(f"Configuration written to {VALUES_FILE}")
 
 
-def read_namespace_from_values() -> str:
+def read_namespace_from_values(content: Optional[str] = None) -> str:
     """
     Read the namespace from an existing laminar.yaml.
     
+    Args:
+        content: Contents of laminar.yaml if already read; read from disk otherwise
+        
     Returns:
         Namespace string, defaults to 'default' if not found
     """
-    if not VALUES_FILE.exists():
-        return 'default'
+    if content is None:
+        try:
+            content = VALUES_FILE.read_text()
+        except FileNotFoundError:
+            return 'default'
     
-    for line in VALUES_FILE.read_text().splitlines():
-        if line.startswith('# namespace:'):
-            return line.split(':', 1)[1].strip()
+    match = _NAMESPACE_RE.search(content)
+    if match:
+        return match.group('namespace').strip()
     
     return 'default'
@@ -1,6 +1,34 @@
 """YAML generation utilities without external dependencies."""
 
-from typing import Any, List, Dict, Union
+import re
+from typing import Any, List, Dict, Optional, Union
+
+# Escapes backslashes, double quotes and control characters for YAML
+# double-quoted strings
+_YAML_ESCAPES = str.maketrans({
+    **{chr(c): f'\\x{c:02x}' for c in (*range(0x20), 0x7f)},
+    '\t': '\\t',
+    '\n': '\\n',
+    '\r': '\\r',
+    '\\': '\\\\',
+    '"': '\\"',
+})
+
+# Indentation strings for the nesting depths values files actually reach
+_PREFIXES = tuple('  ' * i for i in range(32))
+
+# Finds the first KEY: inside dataPlaneProxy.loadBalancer. Lines nested under
+# a key must be indented deeper than the key's own indent (\g<i>, \g<j>);
+# blank and comment lines are skipped. The value is captured already unquoted.
+_LB_KEY_PATTERN = r"""
+    ^(?P<i>[ \t]*)dataPlaneProxy:[ \t]*(?:\#[^\r\n]*)?\r?\n
+    (?:(?:[ \t]*(?:\#[^\r\n]*)?|(?P=i)[ \t]+[^\s#][^\r\n]*)\r?\n)*?
+    (?P<j>(?P=i)[ \t]+)loadBalancer:[ \t]*(?:\#[^\r\n]*)?\r?\n
+    (?:(?:[ \t]*(?:\#[^\r\n]*)?|(?P=j)[ \t]+(?!KEY:)[^\s#][^\r\n]*)\r?\n)*?
+    (?P=j)[ \t]+KEY:[ \t]*["']*(?P<value>[^\s#"']*)
+"""
+_LB_ENABLED_RE = re.compile(_LB_KEY_PATTERN.replace('KEY', 'enabled'), re.MULTILINE | re.VERBOSE)
+_LB_PORT_RE = re.compile(_LB_KEY_PATTERN.replace('KEY', 'port'), re.MULTILINE | re.VERBOSE)
 
 
 def _yaml_scalar(value: Any) -> str:
@@ -13,51 +41,48 @@ def _yaml_scalar(value: Any) -> str:
     Returns:
         YAML-formatted string representation
     """
-    if isinstance(value, bool):
+    if type(value) is bool:
         return 'true' if value else 'false'
-    if isinstance(value, int):
+    if type(value) is int:
         return str(value)
     if isinstance(value, str):
         if value == '':
             return '""'
-        # Escape backslashes and double quotes for YAML double-quoted strings
-        # Must escape backslashes first to avoid double-escaping
-        escaped = value.replace('\\', '\\\\').replace('"', '\\"')
-        return f'"{escaped}"'
+        # Most values are plain printable ASCII and need no escaping; a couple
+        # of C-level scans let them skip building a new string
+        if (value.isascii() and value.isprintable()
+                and '\\' not in value and '"' not in value):
+            return f'"{value}"'
+        return f'"{value.translate(_YAML_ESCAPES)}"'
     return str(value)
 
 
-def _yaml_lines(obj: Union[Dict, List], indent: int = 0) -> List[str]:
+def _yaml_emit(obj: Union[Dict, List], out: List[str], indent: int = 0) -> None:
     """
-    Recursively render a dict/list to YAML lines.
+    Recursively render a dict/list as YAML lines appended to a shared list.
     
     Args:
         obj: Dictionary or list to convert
+        out: List that receives the YAML-formatted lines (modified in place)
         indent: Current indentation level
-        
-    Returns:
-        List of YAML-formatted strings
     """
-    lines = []
-    prefix = '  ' * indent
+    prefix = _PREFIXES[indent] if indent < len(_PREFIXES) else '  ' * indent
     
     if isinstance(obj, dict):
         for key, value in obj.items():
             if isinstance(value, (dict, list)):
-                lines.append(f"{prefix}{key}:")
-                lines.extend(_yaml_lines(value, indent + 1))
+                out.append(f"{prefix}{key}:")
+                _yaml_emit(value, out, indent + 1)
             else:
-                lines.append(f"{prefix}{key}: {_yaml_scalar(value)}")
+                out.append(f"{prefix}{key}: {_yaml_scalar(value)}")
     
     elif isinstance(obj, list):
         for item in obj:
             if isinstance(item, (dict, list)):
-                lines.append(f"{prefix}-")
-                lines.extend(_yaml_lines(item, indent + 1))
+                out.append(f"{prefix}-")
+                _yaml_emit(item, out, indent + 1)
             else:
-                lines.append(f"{prefix}- {_yaml_scalar(item)}")
-    
-    return lines
+                out.append(f"{prefix}- {_yaml_scalar(item)}")
 
 
 def dict_to_yaml(obj: Dict) -> str:
@@ -70,7 +95,9 @@ def dict_to_yaml(obj: Dict) -> str:
     Returns:
         YAML-formatted string
     """
-    return '\n'.join(_yaml_lines(obj)) + '\n'
+    out: List[str] = []
+    _yaml_emit(obj, out)
+    return '\n'.join(out) + '\n'
 
 
 def is_loadbalancer_disabled(yaml_content: str) -> bool:
@@ -88,44 +115,26 @@ def is_loadbalancer_disabled(yaml_content: str) -> bool:
     Returns:
         True if LoadBalancer is explicitly disabled, False otherwise
     """
-    lines = yaml_content.splitlines()
-    in_data_plane_proxy = False
-    in_load_balancer = False
-    data_plane_indent = -1
+    match = _LB_ENABLED_RE.search(yaml_content)
+    if not match:
+        # If loadBalancer section not found or enabled not specified, assume enabled
+        return False
+    return match.group('value').lower() == 'false'
+
+
+def get_loadbalancer_port(yaml_content: str) -> Optional[str]:
+    """
+    Get the LoadBalancer port configured in the YAML content.
     
-    for line in lines:
-        # Skip comments and empty lines
-        stripped = line.lstrip()
-        if not stripped or stripped.startswith('#'):
-            continue
-        
-        # Calculate indentation level
-        indent = len(line) - len(stripped)
-        
-        # Reset sections if we're back at root level or parent level
-        if in_load_balancer and indent <= data_plane_indent:
-            in_load_balancer = False
-        if in_data_plane_proxy and indent <= data_plane_indent:
-            in_data_plane_proxy = False
-            in_load_balancer = False
-        
-        # Check for dataPlaneProxy section
-        if stripped.startswith('dataPlaneProxy:'):
-            in_data_plane_proxy = True
-            data_plane_indent = indent
-            continue
-        
-        # Check for loadBalancer section within dataPlaneProxy
-        if in_data_plane_proxy and stripped.startswith('loadBalancer:'):
-            in_load_balancer = True
-            continue
-        
-        # Check for enabled: false within loadBalancer section
-        if in_load_balancer and stripped.startswith('enabled:'):
-            value = stripped.split(':', 1)[1].strip().lower()
-            # Remove quotes if present
-            value = value.strip('"').strip("'")
-            return value == 'false'
+    Only a 'port:' nested under dataPlaneProxy.loadBalancer is considered.
     
-    # If loadBalancer section not found or enabled not specified, assume enabled
-    return False
+    Args:
+        yaml_content: The YAML content as a string
+        
+    Returns:
+        The port as a string, or None if not set
+    """
+    match = _LB_PORT_RE.search(yaml_content)
+    if not match or not match.group('value'):
+        return None
+    return match.group('value')
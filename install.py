@@ -6,8 +6,8 @@ Zero-dependency CLI that guides users through configuration and deployment.
 """
 
 import sys
-import argparse
 import time
+from types import SimpleNamespace
 from _install_helpers.constants import (
     RELEASE_NAME, LB_SERVICE_NAME, VALUES_FILE, YELLOW, RESET,
     ESTIMATE_HELM_INSTALL, ESTIMATE_POD_READINESS,
@@ -15,37 +15,56 @@ from _install_helpers.constants import (
 )
 from _install_helpers.ui import (
     print_header, print_section, print_info, print_success,
-    print_error, print_warning, print_final_url
+    print_error, print_warning, print_final_url, print_block, format_info
 )
-from _install_helpers.input_utils import get_yes_no
-from _install_helpers.prerequisites import check_prerequisites
-from _install_helpers.config import configure
-from _install_helpers.values import (
-    build_values, write_values_file_with_namespace, read_namespace_from_values
-)
-from _install_helpers.yaml_utils import is_loadbalancer_disabled
-from _install_helpers.helm import build_helm_cmd, run_helm, wait_for_pods_ready, get_load_balancer_url
+
+# The remaining helpers are imported inside update_only() and main(), so
+# each path (and --help) only loads the modules it actually uses
+
+
+def _elapsed_seconds(start_ns: int) -> int:
+    """Whole seconds elapsed since a time.monotonic_ns() timestamp."""
+    return (time.monotonic_ns() - start_ns) // 1_000_000_000
+
+
+def _format_elapsed(start_ns: int) -> str:
+    """Format the time elapsed since a time.monotonic_ns() timestamp as 'Xm Ys'."""
+    mins, secs = divmod(_elapsed_seconds(start_ns), 60)
+    return f"{mins}m {secs}s"
 
 
 def update_only() -> None:
     """Re-apply existing laminar.yaml without interactive prompts."""
+    from _install_helpers.values import read_namespace_from_values
+    from _install_helpers.yaml_utils import is_loadbalancer_disabled, get_loadbalancer_port
+    from _install_helpers.helm import (
+        build_helm_cmd, run_helm, wait_for_pods_ready,
+        start_load_balancer_lookup, get_load_balancer_url
+    )
+
     print_header("Laminar Data Plane - Update")
 
-    if not VALUES_FILE.exists():
+    # Read laminar.yaml once; the namespace, LoadBalancer and port lookups
+    # below all reuse this content
+    try:
+        content = VALUES_FILE.read_text()
+    except FileNotFoundError:
         print_error(f"{VALUES_FILE.name} not found!")
         print_info("Please run the full installation first: python3 install.py")
         sys.exit(1)
 
-    print("Updating existing installation...")
-    print("This will re-apply laminar.yaml and pull latest container images.\n")
+    print_block([
+        "Updating existing installation...",
+        "This will re-apply laminar.yaml and pull latest container images.\n",
+    ])
 
-    namespace = read_namespace_from_values()
+    namespace = read_namespace_from_values(content)
     print_success(f"Using configuration from {VALUES_FILE.name}")
     print_info(f"Namespace: {namespace}\n")
     
     print_info("Estimated time: 2-4 minutes")
 
-    start_time = time.time()
+    start_ns = time.monotonic_ns()
     args = build_helm_cmd(namespace)
 
     print_section("Running Helm Upgrade")
@@ -57,39 +76,42 @@ def update_only() -> None:
 
     print_success("Helm upgrade completed successfully!\n")
 
+    lb_disabled = is_loadbalancer_disabled(content)
+    # Resolve the LoadBalancer URL while the pods come up
+    lb_lookup = None if lb_disabled else start_load_balancer_lookup(namespace)
+
     # Wait for pods to be ready
     print_section("Waiting for Pods to be Ready")
     if not wait_for_pods_ready(namespace):
         print_warning("Pods did not become ready within the timeout period.")
         print_info("Check pod status: kubectl get pods -n " + namespace)
 
-    content = VALUES_FILE.read_text()
-    lb_disabled = is_loadbalancer_disabled(content)
-    
-    total_elapsed = int(time.time() - start_time)
-    mins = total_elapsed // 60
-    secs = total_elapsed % 60
+    total_elapsed = _format_elapsed(start_ns)
     
     if not lb_disabled:
-        url = get_load_balancer_url(namespace)
-        port = '40080'
-        for line in content.splitlines():
-            stripped = line.strip()
-            if stripped.startswith('port:') and 'loadBalancer' not in stripped:
-                port = stripped.split(':')[1].strip().strip('"')
-                break
+        url = get_load_balancer_url(namespace, lb_lookup)
+        port = get_loadbalancer_port(content) or '40080'
         
         if url:
             print_final_url(url, port)
-            print_info(f"\nTotal update time: {mins}m {secs}s")
+            print_info(f"\nTotal update time: {total_elapsed}")
         else:
             print_warning("Could not retrieve LoadBalancer URL yet.")
             print_info(f"Check manually: kubectl get svc {LB_SERVICE_NAME} -n {namespace}")
-            print_info(f"\nTotal update time: {mins}m {secs}s")
+            print_info(f"\nTotal update time: {total_elapsed}")
 
 
 def parse_arguments():
     """Parse command-line arguments."""
+    # The two common invocations need no parser; argparse is only imported
+    # and built for --help or anything unexpected
+    argv = sys.argv[1:]
+    if not argv:
+        return SimpleNamespace(update_only=False)
+    if argv == ['-u'] or argv == ['--update-only']:
+        return SimpleNamespace(update_only=True)
+
+    import argparse
     parser = argparse.ArgumentParser(
         description='Laminar Data Plane - Helm Interactive Installer',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -130,23 +152,32 @@ def main() -> None:
             sys.exit(0)
         return
 
+    from _install_helpers.input_utils import get_yes_no
+    from _install_helpers.prerequisites import check_prerequisites
+    from _install_helpers.config import configure
+    from _install_helpers.values import build_values, write_values_file_with_namespace
+    from _install_helpers.helm import (
+        build_helm_cmd, run_helm, wait_for_pods_ready,
+        start_load_balancer_lookup, get_load_balancer_url
+    )
+
     print_header("Laminar Data Plane - Helm Installer")
 
-    print("Welcome to the Laminar Data Plane installer!")
-    print("This wizard will guide you through configuring and deploying")
-    print("the Laminar Data Plane on your Kubernetes cluster.\n")
-    
-    print_info(f"Estimated time: {ESTIMATE_TOTAL_MIN}-{ESTIMATE_TOTAL_MAX} minutes")
-    print_info("TIP: Use Ctrl-C at any prompt to retry that section or exit")
-    print_info("TIP: Use arrow keys to navigate input history\n")
+    print_block([
+        "Welcome to the Laminar Data Plane installer!",
+        "This wizard will guide you through configuring and deploying",
+        "the Laminar Data Plane on your Kubernetes cluster.\n",
+        format_info(f"Estimated time: {ESTIMATE_TOTAL_MIN}-{ESTIMATE_TOTAL_MAX} minutes"),
+        format_info("TIP: Use Ctrl-C at any prompt to retry that section or exit"),
+        format_info("TIP: Use arrow keys to navigate input history\n"),
+    ])
 
     try:
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         
         print_section("Prerequisites Check (~5 seconds)")
         context = check_prerequisites()
-        elapsed = int(time.time() - start_time)
-        print_success(f"Prerequisites check complete ({elapsed}s)\n")
+        print_success(f"Prerequisites check complete ({_elapsed_seconds(start_ns)}s)\n")
         
         config = configure(context)
         namespace = config['namespace']
@@ -155,12 +186,15 @@ def main() -> None:
         write_values_file_with_namespace(values, namespace)
 
         print_section("Ready to Deploy")
-        print_info(f"Release name:         {RELEASE_NAME}")
-        print_info(f"Namespace:            {namespace}")
-        print_info(f"Values file:          {VALUES_FILE}")
+        summary = [
+            format_info(f"Release name:         {RELEASE_NAME}"),
+            format_info(f"Namespace:            {namespace}"),
+            format_info(f"Values file:          {VALUES_FILE}"),
+        ]
         if config.get('s3_enabled'):
-            print_info(f"ClickHouse bucket:    {config['ch_bucket']}")
-        print()
+            summary.append(format_info(f"ClickHouse bucket:    {config['ch_bucket']}"))
+        summary.append("")
+        print_block(summary)
 
         confirm = get_yes_no("Proceed with installation?", default=True)
         if not confirm:
@@ -172,40 +206,39 @@ def main() -> None:
         args = build_helm_cmd(namespace)
 
         print_section(f"Running Helm Install (~{ESTIMATE_HELM_INSTALL} seconds)")
-        helm_start = time.time()
+        helm_start_ns = time.monotonic_ns()
         returncode = run_helm(args)
 
         if returncode != 0:
             print_error("Helm install failed")
             sys.exit(1)
 
-        helm_elapsed = int(time.time() - helm_start)
-        print_success(f"Helm install completed successfully! ({helm_elapsed}s)\n")
+        print_success(f"Helm install completed successfully! ({_elapsed_seconds(helm_start_ns)}s)\n")
+
+        # LoadBalancer provisioning starts as soon as helm applies the Service,
+        # so resolve its URL while waiting for the pods
+        lb_enabled = config.get('lb_enabled', True)
+        lb_lookup = start_load_balancer_lookup(namespace) if lb_enabled else None
 
         # Wait for pods to be ready
         print_section(f"Waiting for Pods to be Ready (~{ESTIMATE_POD_READINESS} seconds)")
-        pods_start = time.time()
+        pods_start_ns = time.monotonic_ns()
         if not wait_for_pods_ready(namespace):
             print_warning("Pods did not become ready within the timeout period.")
             print_info("Check pod status: kubectl get pods -n " + namespace)
             print_info("Check pod logs: kubectl logs -l app.kubernetes.io/name=laminar-clickhouse -n " + namespace)
             sys.exit(1)
 
-        pods_elapsed = int(time.time() - pods_start)
-        print_success(f"All pods are ready! ({pods_elapsed}s)\n")
+        print_success(f"All pods are ready! ({_elapsed_seconds(pods_start_ns)}s)\n")
 
-        lb_enabled = config.get('lb_enabled', True)
         lb_port = config.get('lb_port', '40080')
-        
-        total_elapsed = int(time.time() - start_time)
-        mins = total_elapsed // 60
-        secs = total_elapsed % 60
+        total_elapsed = _format_elapsed(start_ns)
         
         if lb_enabled:
-            url = get_load_balancer_url(namespace)
+            url = get_load_balancer_url(namespace, lb_lookup)
             if url:
                 print_final_url(url, lb_port)
-                print_info(f"\nTotal installation time: {mins}m {secs}s")
+                print_info(f"\nTotal installation time: {total_elapsed}")
             else:
                 print()
                 print_warning("LoadBalancer URL is not available yet.")
@@ -215,7 +248,7 @@ def main() -> None:
             print()
             print_header("Installation Complete!")
             print_success("Laminar Data Plane is deployed (no external LoadBalancer).")
-            print_info(f"\nTotal installation time: {mins}m {secs}s")
+            print_info(f"\nTotal installation time: {total_elapsed}")
 
     except KeyboardInterrupt:
         print(f"\n{YELLOW}Installation cancelled by user{RESET}")